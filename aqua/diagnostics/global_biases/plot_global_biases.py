@@ -129,20 +129,20 @@ class PlotGlobalBiases:
         lat_sub = mask_sub.lat
         lon_sub = mask_sub.lon
 
-        # Create 2D coordinate grids for plotting
-        # This maps each grid point to its geographic location
-        lon_mesh, lat_mesh = np.meshgrid(lon_sub, lat_sub)
-
         # Optionally invert the mask:
         # - False (default): stipple where differences ARE significant
         # - True: stipple where differences are NOT significant
         mask_to_plot = ~mask_sub if invert_mask else mask_sub
 
+        # Locate the (lat, lon) indices of the points to stipple and map them
+        # to geographic coordinates directly, without building 2D lon/lat grids
+        lat_idx, lon_idx = np.nonzero(mask_to_plot.values)
+
         # Plot stippling using a scatter plot:
         # dots are placed only at grid points where mask_to_plot is True
         ax.scatter(
-            lon_mesh[mask_to_plot.values],
-            lat_mesh[mask_to_plot.values],
+            lon_sub.values[lon_idx],
+            lat_sub.values[lat_idx],
             s=stipple_size,
             c=stipple_color,
             transform=ccrs.PlateCarree(),
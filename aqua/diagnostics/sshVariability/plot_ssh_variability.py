@@ -39,6 +39,8 @@ class SshVariabilityPlot(PlotBaseMixin):
 
         self.loglevel = loglevel
         self.outputdir = outputdir
+        # Shared across subregion selections of both the dataset and the reference
+        self.area_sel = AreaSelection(loglevel=self.loglevel)
 
         super().__init__(diagnostic_name=diagnostic_name, loglevel=loglevel)
 
@@ -547,6 +549,4 @@ class SshVariabilityPlot(PlotBaseMixin):
         if "ICON" in model and mask_southern_boundary and southern_boundary_latitude:
             data = data.where(data.lat > southern_boundary_latitude)
 
-        area_sel = AreaSelection(loglevel=self.loglevel)
-
-        return area_sel.select_area(data, lon=lon_lim, lat=lat_lim, drop=True)
+        return self.area_sel.select_area(data, lon=lon_lim, lat=lat_lim, drop=True)